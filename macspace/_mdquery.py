@@ -0,0 +1,145 @@
+"""
+Minimal ctypes binding to the Spotlight MDQuery C API (CoreServices).
+
+Lets get_installed_apps query Spotlight in-process instead of spawning
+`mdfind` and parsing its stdout.
+"""
+
+import ctypes
+import threading
+
+_CORE_FOUNDATION = "/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation"
+_CORE_SERVICES = "/System/Library/Frameworks/CoreServices.framework/CoreServices"
+
+kCFStringEncodingUTF8 = 0x08000100
+kMDQuerySynchronous = 1
+
+# How long to wait for a stopped query to return before giving up on it
+_STOP_GRACE = 0.2
+
+_lib = None
+
+
+def _load():
+    """
+    Load CoreFoundation/CoreServices once and declare the signatures we use.
+    Raises OSError when the frameworks are unavailable (e.g. not on macOS).
+    """
+    global _lib
+    if _lib is not None:
+        return _lib
+    cf = ctypes.CDLL(_CORE_FOUNDATION)
+    cs = ctypes.CDLL(_CORE_SERVICES)
+
+    cf.CFStringCreateWithCString.restype = ctypes.c_void_p
+    cf.CFStringCreateWithCString.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_uint32]
+    cf.CFStringGetCString.restype = ctypes.c_bool
+    cf.CFStringGetCString.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_long, ctypes.c_uint32]
+    cf.CFArrayCreate.restype = ctypes.c_void_p
+    cf.CFArrayCreate.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p), ctypes.c_long, ctypes.c_void_p]
+    cf.CFRelease.restype = None
+    cf.CFRelease.argtypes = [ctypes.c_void_p]
+
+    cs.MDQueryCreate.restype = ctypes.c_void_p
+    cs.MDQueryCreate.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p]
+    cs.MDQuerySetSearchScope.restype = None
+    cs.MDQuerySetSearchScope.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint32]
+    cs.MDQuerySetMaxCount.restype = None
+    cs.MDQuerySetMaxCount.argtypes = [ctypes.c_void_p, ctypes.c_long]
+    cs.MDQueryExecute.restype = ctypes.c_bool
+    cs.MDQueryExecute.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+    cs.MDQueryStop.restype = None
+    cs.MDQueryStop.argtypes = [ctypes.c_void_p]
+    cs.MDQueryGetResultCount.restype = ctypes.c_long
+    cs.MDQueryGetResultCount.argtypes = [ctypes.c_void_p]
+    cs.MDQueryGetAttributeValueOfResultAtIndex.restype = ctypes.c_void_p
+    cs.MDQueryGetAttributeValueOfResultAtIndex.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_long]
+
+    _lib = (cf, cs)
+    return _lib
+
+
+def _cfstr(cf, s):
+    # Runtime equivalent of the CFSTR() macro; caller must CFRelease.
+    return cf.CFStringCreateWithCString(None, s.encode("utf-8"), kCFStringEncodingUTF8)
+
+
+def _to_str(cf, ref, buf):
+    if not ref or not cf.CFStringGetCString(ref, buf, len(buf), kCFStringEncodingUTF8):
+        return None
+    return buf.value.decode("utf-8")
+
+
+def _cfarray(cf, refs):
+    # Caller must CFRelease; the array retains its elements.
+    callbacks = ctypes.c_void_p.in_dll(cf, "kCFTypeArrayCallBacks")
+    values = (ctypes.c_void_p * len(refs))(*refs)
+    return cf.CFArrayCreate(None, values, len(refs), ctypes.addressof(callbacks))
+
+
+def mdquery_apps(query_string, limit=500, scopes=None, timeout=None):
+    """
+    Return the app bundle names (without ".app") matching the Spotlight
+    `query_string`, e.g. "kMDItemContentType == 'com.apple.application-bundle'".
+    At most `limit` results are gathered server-side via MDQuerySetMaxCount.
+    `scopes` optionally restricts the search to these directories (like
+    `mdfind -onlyin`). If the query runs longer than `timeout` seconds it is
+    stopped with MDQueryStop and the results gathered so far are returned,
+    or None if there are none: a timeout says nothing about whether apps
+    exist. Raises OSError if the query cannot be created or run.
+    """
+    cf, cs = _load()
+    query_str = _cfstr(cf, query_string)
+    # We read the on-disk bundle name rather than kMDItemDisplayName: the
+    # display name is localized and would not match the directory scan.
+    attr = _cfstr(cf, "kMDItemFSName")
+    value_list = _cfarray(cf, [attr])
+    query = cs.MDQueryCreate(None, query_str, value_list, None)
+    stuck = timed_out = False
+    try:
+        if not query:
+            raise OSError("MDQueryCreate failed")
+        if scopes:
+            scope_strs = [_cfstr(cf, d) for d in scopes]
+            scope_list = _cfarray(cf, scope_strs)
+            cs.MDQuerySetSearchScope(query, scope_list, 0)
+            cf.CFRelease(scope_list)
+            for ref in scope_strs:
+                cf.CFRelease(ref)
+        cs.MDQuerySetMaxCount(query, limit)
+        # Run the synchronous query on a worker so we can stop it on timeout.
+        finished = threading.Event()
+        result = []
+
+        def execute():
+            try:
+                result.append(cs.MDQueryExecute(query, kMDQuerySynchronous))
+            finally:
+                finished.set()
+
+        threading.Thread(target=execute, daemon=True).start()
+        if not finished.wait(timeout):
+            cs.MDQueryStop(query)
+            if not finished.wait(_STOP_GRACE):
+                # Still inside MDQueryExecute: the query can be neither read
+                # nor released safely, so leak it and report nothing.
+                stuck = True
+                return None
+            timed_out = True
+        elif not result or not result[0]:
+            raise OSError("MDQueryExecute failed")
+        apps = set()
+        buf = ctypes.create_string_buffer(1024)
+        for i in range(cs.MDQueryGetResultCount(query)):
+            name = _to_str(cf, cs.MDQueryGetAttributeValueOfResultAtIndex(query, attr, i), buf)
+            if name and name.endswith(".app"):
+                apps.add(name[:-4])
+        if timed_out and not apps:
+            return None
+        return apps
+    finally:
+        if query and not stuck:
+            cf.CFRelease(query)
+        cf.CFRelease(value_list)
+        cf.CFRelease(attr)
+        cf.CFRelease(query_str)
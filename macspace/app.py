@@ -2,112 +2,520 @@
 """
 macspace CLI - simple workspace manager for macOS.
 
-Workspaces stored at: ~/.macspace/workspaces.json
-Each workspace is a dict: {"name": <str>, "apps": [<app name strings>]}
+Workspaces stored at: ~/.macspace/workspaces.mp (MessagePack) when the
+optional `msgpack` package is installed, else ~/.macspace/workspaces.json.
+On disk, each workspace is a dict: {"name": <str>, "apps": [<app name strings>]}.
+In memory (see load_data), workspaces are keyed by name and apps are sets.
 """
 
-import argparse
-import json
 import os
-import subprocess
 import sys
-from pathlib import Path
 
-CONFIG_DIR = Path.home() / ".macspace"
-CONFIG_FILE = CONFIG_DIR / "workspaces.json"
+# threading, time, types, json, subprocess, shutil and argparse are
+# imported inside the functions that need them, and paths are plain os.path
+# strings rather than pathlib objects, to keep start-up cheap for quick
+# commands like `list`.
+
+try:
+    import msgpack
+except ImportError:  # optional: fall back to JSON storage
+    msgpack = None
+
+HOME_DIR = os.path.expanduser("~")
+CONFIG_DIR = os.path.join(HOME_DIR, ".macspace")
+JSON_CONFIG_FILE = os.path.join(CONFIG_DIR, "workspaces.json")
+MSGPACK_CONFIG_FILE = os.path.join(CONFIG_DIR, "workspaces.mp")
+CONFIG_FILE = MSGPACK_CONFIG_FILE if msgpack is not None else JSON_CONFIG_FILE
+_CONFIG_READY = False  # set once ensure_config has run in this process
+BACKUP_COUNT = 5  # rotating backups of the workspaces file kept on save
+APPS_CACHE_FILE = os.path.join(CONFIG_DIR, "apps.cache.json")
+# /System/Applications holds the built-in apps (Mail, Notes, ...) on macOS 10.15+
+APP_DIRS = ["/Applications", "/System/Applications", os.path.join(HOME_DIR, "Applications")]
+APPS_CACHE_TTL = 3600  # seconds
+SCAN_TIMEOUT = 2  # seconds, budget for the folder + Spotlight scan
+SPOTLIGHT_TIMEOUT = 1.0  # seconds; Spotlight only adds coverage, so cut it short
+SPOTLIGHT_MAX_RESULTS = 500
+APP_BUNDLE_QUERY = "kMDItemContentType == 'com.apple.application-bundle'"
+SYSTEM_PROFILER_TIMEOUT = 30  # seconds, for the background-only Spotlight-less fallback
+_INSTALLED_APPS = None  # (app folders mtime, sorted tuple) for this process
+DEBUG = bool(os.environ.get("MACSPACE_DEBUG"))
+
+# JSON (de)serialization on bytes. Plain stdlib json: the files are small
+# enough that a faster parser (orjson) loses more to its import than it saves.
+# Imported lazily so msgpack stores with a warm cache never load it.
+
+
+def _loads(raw):
+    import json
+
+    return json.loads(raw)
+
+
+def _dumps(data):
+    import json
+
+    if DEBUG:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _encode(data):
+    if msgpack is not None:
+        return msgpack.packb(data, use_bin_type=True)
+    return _dumps(data)
+
+
+def _decode(raw):
+    if msgpack is not None:
+        return msgpack.unpackb(raw, raw=False)
+    return _loads(raw)
+
+
+def _read_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _write_atomic(path, raw):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(raw)
+    os.replace(tmp, path)
+
+
+def _backup_path(i):
+    return f"{CONFIG_FILE}.{i}.bak"
+
+
+def _rotate_backups():
+    # Keep the last BACKUP_COUNT versions: .0.bak is the newest.
+    import shutil
+
+    for i in range(BACKUP_COUNT - 1, 0, -1):
+        try:
+            os.replace(_backup_path(i - 1), _backup_path(i))
+        except FileNotFoundError:
+            pass
+    try:
+        shutil.copy2(CONFIG_FILE, _backup_path(0))
+    except FileNotFoundError:
+        pass
+
+
+def _write_config(data):
+    # The write goes to a temp sibling that is renamed over the config file;
+    # rename is atomic on POSIX, so an interrupted save never leaves a
+    # truncated file and no fsync is needed per command.
+    raw = _encode(data)
+    _rotate_backups()
+    _write_atomic(CONFIG_FILE, raw)
 
 
 def ensure_config():
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    if not CONFIG_FILE.exists():
-        with CONFIG_FILE.open("w", encoding="utf-8") as f:
-            json.dump({"workspaces": []}, f)
+    global _CONFIG_READY
+    if _CONFIG_READY:
+        return
+    # Exclusive create doubles as the existence check; the directory is only
+    # created when that fails because it is missing.
+    try:
+        f = open(CONFIG_FILE, "xb")
+    except FileExistsError:
+        f = None
+    except FileNotFoundError:
+        os.makedirs(CONFIG_DIR, exist_ok=True)
+        f = open(CONFIG_FILE, "xb")
+    if f is not None and CONFIG_FILE == JSON_CONFIG_FILE and os.path.exists(MSGPACK_CONFIG_FILE):
+        # The data was migrated to MessagePack but msgpack is gone; don't
+        # silently start over with an empty JSON store.
+        f.close()
+        os.remove(CONFIG_FILE)
+        raise SystemExit(
+            f"Workspaces are stored in {MSGPACK_CONFIG_FILE} but the msgpack package is not installed.\n"
+            "Install it with: pip install 'macspace[msgpack]'"
+        )
+    if f is not None:
+        # First run with msgpack available: migrate the JSON store and keep
+        # the original around as workspaces.json.bak.
+        migrate = CONFIG_FILE != JSON_CONFIG_FILE and os.path.exists(JSON_CONFIG_FILE)
+        try:
+            with f:
+                if migrate:
+                    data = _loads(_read_bytes(JSON_CONFIG_FILE))
+                else:
+                    data = {"workspaces": []}
+                f.write(_encode(data))
+        except BaseException:
+            os.remove(CONFIG_FILE)
+            raise
+        if migrate:
+            os.replace(JSON_CONFIG_FILE, JSON_CONFIG_FILE + ".bak")
+    _CONFIG_READY = True
 
 
 def load_data():
+    """
+    Load workspaces into their in-memory layout:
+        {"workspaces": {name: {"name": name, "apps": {app, ...}}}}
+    The on-disk list-of-dicts schema is unchanged; save_data converts back
+    (apps sorted), so files stay compatible with older versions.
+    """
     ensure_config()
-    with CONFIG_FILE.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    raw = _decode(_read_bytes(CONFIG_FILE))
+    return {
+        "workspaces": {
+            w["name"]: {"name": w["name"], "apps": set(w["apps"])} for w in raw["workspaces"]
+        }
+    }
 
 
 def save_data(data):
     ensure_config()
-    with CONFIG_FILE.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    _write_config(
+        {
+            "workspaces": [
+                {"name": w["name"], "apps": sorted(w["apps"])} for w in data["workspaces"].values()
+            ]
+        }
+    )
 
 
-def get_installed_apps():
+class WorkspaceStore:
     """
-    Return a sorted list of app "display names" found in typical macOS app folders.
-    We look in /Applications and ~/Applications, and pick the bundle names without suffix.
+    Load workspaces once and write them back at most once:
+
+        with WorkspaceStore() as store:
+            store.data["workspaces"][ws["name"]] = ws
+            store.modify()
+
+    Nested `with` blocks on the same store are folded into the outermost one,
+    so several commands can share one store and produce a single write.
     """
-    app_paths = [Path("/Applications"), Path.home() / "Applications"]
+
+    def __init__(self):
+        self.data = None
+        self.dirty = False
+        self._depth = 0
+
+    def __enter__(self):
+        if self._depth == 0:
+            self.data = load_data()
+            self.dirty = False
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._depth -= 1
+        # Don't persist half-applied changes if a command blew up.
+        if self._depth == 0 and exc_type is None:
+            self.flush()
+        return False
+
+    def modify(self):
+        self.dirty = True
+
+    def flush(self):
+        if self.dirty:
+            save_data(self.data)
+            self.dirty = False
+
+
+def _bundle_name(path):
+    # "/Applications/Foo.app" -> "Foo"; None for anything that isn't a bundle
+    name = os.path.basename(path)
+    return name[:-4] if name.endswith(".app") else None
+
+
+def _discover_dir(path):
+    """Return the bundle names (without ".app") directly inside `path`."""
     apps = set()
-    for p in app_paths:
-        if p.exists():
-            for entry in p.iterdir():
-                if entry.suffix == ".app":
-                    apps.add(entry.stem)
-    # Additional: use mdfind to catch other app installs (spotlight)
+    # Only names are needed, so never stat the entries.
     try:
-        out = subprocess.check_output(
-            ["mdfind", "kMDItemKind == 'Application'"], stderr=subprocess.DEVNULL
-        ).decode("utf-8")
-        for line in out.splitlines():
-            path = Path(line)
-            if path.suffix == ".app":
-                apps.add(path.stem)
+        with os.scandir(path) as it:
+            for entry in it:
+                name = entry.name
+                if name.endswith(".app"):
+                    apps.add(name[:-4])
+    except OSError:
+        # Missing or unreadable folder
+        pass
+    return apps
+
+
+def _discover_mdfind():
+    """
+    Return the app bundle names Spotlight knows about under APP_DIRS,
+    including nested folders such as /Applications/Utilities (empty on failure).
+    Returns None if the query timed out before reporting anything.
+    Set MACSPACE_NO_MDFIND to skip Spotlight, e.g. when indexing is disabled.
+    """
+    if os.environ.get("MACSPACE_NO_MDFIND"):
+        return set()
+    import subprocess
+
+    try:
+        from ._mdquery import mdquery_apps
+
+        return mdquery_apps(
+            APP_BUNDLE_QUERY, limit=SPOTLIGHT_MAX_RESULTS, scopes=APP_DIRS, timeout=SPOTLIGHT_TIMEOUT
+        )
+    except (ImportError, OSError):
+        # Run as a plain script (no package for the relative import), or
+        # CoreServices unavailable / query failed; fall back to mdfind
+        pass
+    apps = set()
+    argv = ["mdfind"]
+    for d in APP_DIRS:
+        argv += ["-onlyin", d]
+    argv.append(APP_BUNDLE_QUERY)
+    try:
+        try:
+            out = subprocess.run(
+                argv, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=SPOTLIGHT_TIMEOUT
+            ).stdout
+        except subprocess.TimeoutExpired as e:
+            # run() has already killed mdfind; keep whatever it printed.
+            if not e.stdout:
+                return None
+            out = e.stdout
+        for line in out.decode("utf-8", "replace").splitlines():
+            name = _bundle_name(line)
+            if name:
+                apps.add(name)
     except Exception:
         # mdfind may be slow or unavailable; ignore failures
         pass
-    return sorted(apps, key=lambda s: s.lower())
+    return apps
 
 
-def find_workspace(data, name):
-    for w in data["workspaces"]:
-        if w["name"] == name:
-            return w
-    return None
+def _discover_system_profiler():
+    """
+    Return the app bundle names under APP_DIRS reported by system_profiler.
+    Works without Spotlight but takes seconds, so it is only a fallback.
+    """
+    import plistlib
+    import subprocess
 
+    apps = set()
+    prefixes = tuple(os.path.join(d, "") for d in APP_DIRS)
+    try:
+        out = subprocess.run(
+            ["system_profiler", "-xml", "-detailLevel", "mini", "SPApplicationsDataType"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=SYSTEM_PROFILER_TIMEOUT,
+            check=True,
+        ).stdout
+        for report in plistlib.loads(out):
+            for item in report.get("_items", []):
+                path = item.get("path", "")
+                name = _bundle_name(path)
+                if name and path.startswith(prefixes):
+                    apps.add(name)
+    except Exception:
+        # system_profiler missing, slow or produced unexpected output
+        pass
+    return apps
 
-def cmd_create(args):
-    data = load_data()
-    if find_workspace(data, args.name):
-        print(f"Workspace '{args.name}' already exists.")
-        return
-    ws = {"name": args.name, "apps": []}
-    if args.apps:
-        # apps passed as comma-separated
-        input_apps = [a.strip() for a in args.apps.split(",") if a.strip()]
-        ws["apps"] = input_apps
-    data["workspaces"].append(ws)
-    save_data(data)
+
+def _scan_installed_apps(full=False):
+    """
+    Return (sorted app "display names", needs_full) for typical macOS app folders.
+    We look in APP_DIRS (/Applications, /System/Applications, ~/Applications),
+    and pick the bundle names without suffix.
+    Spotlight is also queried to catch other app installs. The sources are
+    independent and I/O-bound, so they run concurrently; any source still
+    running after SCAN_TIMEOUT seconds is left out of the result.
+    If Spotlight finds nothing (disabled or failing), system_profiler is
+    needed instead. It takes seconds, so it only runs when `full` is set
+    (the background refresh); otherwise needs_full is True.
+    """
+    import threading
+    import time
+
+    sources = {d: (_discover_dir, d) for d in APP_DIRS}
+    sources["spotlight"] = (_discover_mdfind,)
+    results = {}
+
+    def run(key, func, *args):
+        results[key] = func(*args)
+
+    # Daemon threads rather than an executor: the interpreter joins executor
+    # workers at exit, so a stuck source would still hold up the CLI.
+    threads = [
+        threading.Thread(target=run, args=(key, *source), daemon=True) for key, source in sources.items()
+    ]
+    for t in threads:
+        t.start()
+    deadline = time.monotonic() + SCAN_TIMEOUT
+    for t in threads:
+        t.join(max(0.0, deadline - time.monotonic()))
+    finished = dict(results)  # snapshot; late finishers are ignored
+    apps = {sys.intern(a) for found in finished.values() if found for a in found}
+    # A timed-out query (missing or None) is slow, not unavailable: only fall
+    # back when Spotlight completed with no results.
+    spotlight = finished.get("spotlight")
+    needs_full = spotlight is not None and not spotlight
+    if needs_full and full:
+        apps |= {sys.intern(a) for a in _discover_system_profiler()}
+        needs_full = False
+    return sorted(apps, key=str.lower), needs_full
+
+
+def _load_apps_cache():
+    try:
+        cache = _loads(_read_bytes(APPS_CACHE_FILE))
+        return cache["ts"], [sys.intern(a) for a in cache["apps"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_apps_cache(apps):
+    import time
+
+    os.makedirs(CONFIG_DIR, exist_ok=True)
+    _write_atomic(APPS_CACHE_FILE, _dumps({"ts": time.time(), "apps": apps}))
+
+
+def _refresh_apps_cache(full=False):
+    apps, needs_full = _scan_installed_apps(full)
+    try:
+        _save_apps_cache(apps)
+    except OSError:
+        pass
+    if needs_full:
+        # Let the slow system_profiler fallback fill the cache in later.
+        _revalidate_in_background()
+    return apps
+
+
+def _revalidate_in_background():
+    # A detached child process, so the command returns (and the shell prompt
+    # comes back) without waiting for the rescan.
+    import subprocess
+
+    subprocess.Popen(
+        [sys.executable, "-c", "from macspace.app import _refresh_apps_cache; _refresh_apps_cache(full=True)"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def _app_dirs_text():
+    # "/Applications, /System/Applications or ~/Applications", for messages
+    dirs = [d.replace(HOME_DIR, "~", 1) if d.startswith(HOME_DIR) else d for d in APP_DIRS]
+    return ", ".join(dirs[:-1]) + " or " + dirs[-1]
+
+
+def _app_dirs_mtime():
+    # Newest mtime of the app folders; installing or removing an app bumps it.
+    mtime = 0.0
+    for d in APP_DIRS:
+        try:
+            mtime = max(mtime, os.stat(d).st_mtime)
+        except OSError:
+            pass
+    return mtime
+
+
+def _load_installed_apps(dirs_mtime):
+    """
+    Return the installed apps list, served from ~/.macspace/apps.cache.json.
+    A stale cache is still returned immediately while a background process
+    rescans and rewrites it (stale-while-revalidate). A cache older than the
+    app folders themselves is known to be wrong and is rebuilt right away.
+    """
+    import time
+
+    cached = _load_apps_cache()
+    if cached is None or cached[0] < dirs_mtime:
+        return _refresh_apps_cache()
+    ts, apps = cached
+    if time.time() - ts >= APPS_CACHE_TTL:
+        _revalidate_in_background()
+    return apps
+
+
+def get_installed_apps_sorted(refresh=False):
+    """
+    Return the installed app names sorted case-insensitively, for display.
+    The tuple is cached for this process until the app folders change.
+    """
+    global _INSTALLED_APPS
+    dirs_mtime = _app_dirs_mtime()
+    if refresh or _INSTALLED_APPS is None or _INSTALLED_APPS[0] != dirs_mtime:
+        apps = _refresh_apps_cache() if refresh else _load_installed_apps(dirs_mtime)
+        _INSTALLED_APPS = (dirs_mtime, tuple(apps))
+    return _INSTALLED_APPS[1]
+
+
+def _app_names(apps):
+    # --apps takes separate arguments; a single comma-joined one
+    # ("A, B") is still accepted for backward compatibility.
+    if len(apps) == 1 and "," in apps[0]:
+        return [a.strip() for a in apps[0].split(",") if a.strip()]
+    return apps
+
+
+def _legacy_apps_argv(argv):
+    """
+    Keep the old `macspace create --apps "A,B" NAME` order working: when a
+    comma-joined --apps value comes before the workspace name, attach it as
+    `--apps=A,B` so nargs="+" doesn't also swallow NAME.
+    """
+    out = list(argv)
+    for i, arg in enumerate(out[:-1]):
+        if arg == "--apps":
+            # Only when NAME hasn't been given yet, i.e. it must follow.
+            name_seen = any(not a.startswith("-") for a in out[1:i])
+            if not name_seen and "," in out[i + 1]:
+                out[i : i + 2] = ["--apps=" + out[i + 1]]
+            break
+    return out
+
+
+def _bullets(items):
+    # Pre-join list output so it goes out in one write instead of a print per line.
+    return "".join(f"  - {a}\n" for a in items)
+
+
+def cmd_create(args, store=None):
+    with store or WorkspaceStore() as store:
+        data = store.data
+        if args.name in data["workspaces"]:
+            print(f"Workspace '{args.name}' already exists.")
+            return
+        ws = {"name": args.name, "apps": set()}
+        if args.apps:
+            ws["apps"] = set(_app_names(args.apps))
+        data["workspaces"][args.name] = ws
+        store.modify()
     print(f"Created workspace '{args.name}'.")
-    print("Installed apps detected on this Mac:")
-    apps = get_installed_apps()
-    if not apps:
-        print("  (No apps found in /Applications or ~/Applications)")
-    else:
-        for a in apps:
-            print(f"  - {a}")
+    if args.list_apps:
+        print("Installed apps detected on this Mac:")
+        apps = get_installed_apps_sorted()
+        if not apps:
+            print(f"  (No apps found in {_app_dirs_text()})")
+        else:
+            sys.stdout.write(_bullets(apps))
     if ws["apps"]:
-        print("\nAdded apps to workspace:")
-        for a in ws["apps"]:
-            print(f"  - {a}")
+        sys.stdout.write("\nAdded apps to workspace:\n" + _bullets(sorted(ws["apps"])))
 
 
-def cmd_list(args):
-    data = load_data()
+def cmd_list(args, store=None):
+    with store or WorkspaceStore() as store:
+        data = store.data
     if not data["workspaces"]:
         print("No workspaces. Create one with: macspace create NAME")
         return
-    for w in data["workspaces"]:
-        print(f"- {w['name']} ({len(w['apps'])} apps)")
+    lines = [f"- {w['name']} ({len(w['apps'])} apps)\n" for w in data["workspaces"].values()]
+    sys.stdout.write("".join(lines))
 
 
-def cmd_show(args):
-    data = load_data()
-    w = find_workspace(data, args.name)
+def cmd_show(args, store=None):
+    with store or WorkspaceStore() as store:
+        w = store.data["workspaces"].get(args.name)
     if not w:
         print(f"Workspace '{args.name}' not found.")
         return
@@ -115,110 +523,114 @@ def cmd_show(args):
     if not w["apps"]:
         print("  (no apps added)")
     else:
-        for a in w["apps"]:
-            print(f"  - {a}")
-
-
-def cmd_delete(args):
-    data = load_data()
-    w = find_workspace(data, args.name)
-    if not w:
-        print(f"Workspace '{args.name}' not found.")
-        return
-    data["workspaces"].remove(w)
-    save_data(data)
+        sys.stdout.write(_bullets(sorted(w["apps"])))
+
+
+def cmd_delete(args, store=None):
+    with store or WorkspaceStore() as store:
+        data = store.data
+        w = data["workspaces"].get(args.name)
+        if not w:
+            print(f"Workspace '{args.name}' not found.")
+            return
+        del data["workspaces"][args.name]
+        store.modify()
     print(f"Deleted workspace '{args.name}'.")
 
 
-def cmd_add(args):
-    data = load_data()
-    w = find_workspace(data, args.name)
-    if not w:
-        print(f"Workspace '{args.name}' not found. Create it first.")
-        return
-    apps_to_add = [a.strip() for a in args.apps.split(",") if a.strip()]
-    added = []
-    for a in apps_to_add:
-        if a not in w["apps"]:
-            w["apps"].append(a)
-            added.append(a)
-    save_data(data)
+def cmd_add(args, store=None):
+    with store or WorkspaceStore() as store:
+        w = store.data["workspaces"].get(args.name)
+        if not w:
+            print(f"Workspace '{args.name}' not found. Create it first.")
+            return
+        apps_to_add = _app_names(args.apps)
+        new = set(apps_to_add) - w["apps"]
+        w["apps"] |= new
+        added = sorted(new)
+        if added:
+            store.modify()
     if added:
         print(f"Added: {', '.join(added)}")
     else:
         print("No new apps were added (they may already exist in workspace).")
 
 
-def cmd_remove(args):
-    data = load_data()
-    w = find_workspace(data, args.name)
-    if not w:
-        print(f"Workspace '{args.name}' not found.")
-        return
-    apps_to_remove = [a.strip() for a in args.apps.split(",") if a.strip()]
-    removed = []
-    for a in apps_to_remove:
-        if a in w["apps"]:
-            w["apps"].remove(a)
-            removed.append(a)
-    save_data(data)
+def cmd_remove(args, store=None):
+    with store or WorkspaceStore() as store:
+        w = store.data["workspaces"].get(args.name)
+        if not w:
+            print(f"Workspace '{args.name}' not found.")
+            return
+        apps_to_remove = _app_names(args.apps)
+        removed = sorted(set(apps_to_remove) & w["apps"])
+        w["apps"] -= set(apps_to_remove)
+        if removed:
+            store.modify()
     if removed:
         print(f"Removed: {', '.join(removed)}")
     else:
         print("No matching apps found in workspace.")
 
 
-def open_app(app_name):
-    # Use macOS 'open -a "App Name"'
+def open_apps(app_names):
+    # Use macOS 'open -a "App Name"'. `open` honours only one -a per call, so
+    # launch them all concurrently from a single shell child instead of
+    # spawning one process per app. `open` reports unknown apps on stderr.
+    import subprocess
+
+    script = 'for app do open -a "$app" & done; wait'
     try:
-        subprocess.Popen(["open", "-a", app_name])
+        subprocess.Popen(["sh", "-c", script, "sh", *app_names])
         return True
     except Exception:
         return False
 
 
-def cmd_open(args):
-    data = load_data()
-    w = find_workspace(data, args.name)
+def cmd_open(args, store=None):
+    with store or WorkspaceStore() as store:
+        w = store.data["workspaces"].get(args.name)
     if not w:
         print(f"Workspace '{args.name}' not found.")
         return
     if not w["apps"]:
         print(f"Workspace '{args.name}' has no apps to open.")
         return
+    apps = sorted(w["apps"])
     print(f"Opening workspace '{w['name']}' apps...")
-    installed = set(get_installed_apps())
-    for app in w["apps"]:
-        if app in installed:
-            print(f"  Opening {app} ...")
-            ok = open_app(app)
-            if not ok:
-                print(f"    Failed to open {app} (open command error).")
-        else:
-            # Still try to open — user might have app in different path / name
-            print(f"  Attempting to open {app} (not found in standard locations)...")
-            ok = open_app(app)
-            if not ok:
-                print(f"    Could not open {app}. Is the app name correct?")
+    sys.stdout.write("".join(f"  Opening {app} ...\n" for app in apps))
+    # No installed-apps scan here: `open -a` resolves the app itself.
+    if not open_apps(apps):
+        print("    Could not run the open command.")
 
 
 def cmd_apps(args):
-    apps = get_installed_apps()
+    apps = get_installed_apps_sorted(refresh=args.refresh)
     if not apps:
-        print("No applications detected in /Applications or ~/Applications.")
+        print(f"No applications detected in {_app_dirs_text()}.")
         return
-    print("Installed applications (sample):")
-    for a in apps:
-        print(f"  - {a}")
+    sys.stdout.write("Installed applications (sample):\n" + _bullets(apps))
 
 
 def build_parser():
+    # Imported lazily: argparse (and gettext/textwrap/re behind it) is only
+    # needed when main() can't take a fast path.
+    import argparse
+
     parser = argparse.ArgumentParser(prog="macspace", description="macspace - workspace manager for macOS")
     sub = parser.add_subparsers(dest="command")
 
     p_create = sub.add_parser("create", help="Create a workspace")
     p_create.add_argument("name", help="Workspace name")
-    p_create.add_argument("--apps", help="Comma-separated list of app names to add", default=None)
+    p_create.add_argument(
+        "--apps",
+        nargs="+",
+        default=[],
+        help="App names to add, after the workspace name (quote names with spaces)",
+    )
+    p_create.add_argument(
+        "--list-apps", action="store_true", help="Also list the installed apps detected on this Mac"
+    )
     p_create.set_defaults(func=cmd_create)
 
     p_list = sub.add_parser("list", help="List all workspaces")
@@ -234,12 +646,22 @@ def build_parser():
 
     p_add = sub.add_parser("add", help="Add apps to a workspace")
     p_add.add_argument("name", help="Workspace name")
-    p_add.add_argument("--apps", required=True, help="Comma-separated app names to add")
+    p_add.add_argument(
+        "--apps",
+        nargs="+",
+        required=True,
+        help="App names to add, after the workspace name (quote names with spaces)",
+    )
     p_add.set_defaults(func=cmd_add)
 
     p_remove = sub.add_parser("remove", help="Remove apps from a workspace")
     p_remove.add_argument("name", help="Workspace name")
-    p_remove.add_argument("--apps", required=True, help="Comma-separated app names to remove")
+    p_remove.add_argument(
+        "--apps",
+        nargs="+",
+        required=True,
+        help="App names to remove, after the workspace name (quote names with spaces)",
+    )
     p_remove.set_defaults(func=cmd_remove)
 
     p_open = sub.add_parser("open", help="Open all apps in a workspace")
@@ -247,6 +669,7 @@ def build_parser():
     p_open.set_defaults(func=cmd_open)
 
     p_apps = sub.add_parser("apps", help="List installed macOS apps detected")
+    p_apps.add_argument("--refresh", action="store_true", help="Rescan installed apps instead of using the cache")
     p_apps.set_defaults(func=cmd_apps)
 
     return parser
@@ -254,11 +677,20 @@ def build_parser():
 
 def main(argv=None):
     argv = argv if argv is not None else sys.argv[1:]
+    # Argument-free commands skip building the argparse tree entirely.
+    if argv == ["list"]:
+        cmd_list(None)
+        return
+    if argv == ["apps"]:
+        import types
+
+        cmd_apps(types.SimpleNamespace(refresh=False))
+        return
     parser = build_parser()
     if not argv:
         parser.print_help()
         return
-    args = parser.parse_args(argv)
+    args = parser.parse_args(_legacy_apps_argv(argv))
     if not hasattr(args, "func"):
         parser.print_help()
         return